@@ -1,5 +1,6 @@
 from typing import List, Tuple
 
+import numpy as np
 import shapely
 
 
@@ -12,3 +13,13 @@ def is_point_in_zone(
         [(zone_point[0], zone_point[1]) for zone_point in zone]
     )
     return point.within(polygon)
+
+
+def are_points_in_zone(
+    points: np.ndarray,
+    zone: List[Tuple[float, float]],
+) -> np.ndarray:
+    polygon = shapely.geometry.Polygon(
+        [(zone_point[0], zone_point[1]) for zone_point in zone]
+    )
+    return shapely.contains_xy(polygon, points[:, 0], points[:, 1])
@@ -0,0 +1,359 @@
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, Generator, List, Optional, Union
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+    StatementsGroupsOperator,
+)
+from inference.core.workflows.core_steps.common.query_language.entities.operations import (
+    DEFAULT_OPERAND_NAME,
+    TYPE_PARAMETER_NAME,
+    BinaryStatement,
+    DynamicOperand,
+    ExtractDetectionProperty,
+    OperationDefinition,
+    StatementGroup,
+    StaticOperand,
+    UnaryStatement,
+)
+from inference.core.workflows.core_steps.common.query_language.entities.types import (
+    T,
+)
+from inference.core.workflows.core_steps.common.query_language.errors import (
+    EvaluationEngineError,
+    RoboflowQueryLanguageError,
+    UndeclaredSymbolError,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
+    create_operand_builder,
+)
+from inference.core.workflows.core_steps.common.query_language.evaluation_engine.detection.geometry import (
+    are_points_in_zone,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.detections.base import (
+    PROPERTIES_EXTRACTORS_ARRAY,
+)
+
+MaskFunction = Callable[[sv.Detections], np.ndarray]
+
+
+def _elementwise(
+    operator: Callable[[Any, Any], bool],
+) -> Callable[[np.ndarray, Any], np.ndarray]:
+    def apply(column: np.ndarray, other: Any) -> np.ndarray:
+        return np.fromiter(
+            (operator(value, other) for value in column.tolist()),
+            dtype=bool,
+            count=len(column),
+        )
+
+    return apply
+
+
+def _equals(column: np.ndarray, other: Any) -> np.ndarray:
+    if isinstance(other, (str, int, float, bool)):
+        return np.asarray(column == other, dtype=bool)
+    return _elementwise(lambda a, b: a == b)(column, other)
+
+
+def _is_in(column: np.ndarray, other: Any) -> np.ndarray:
+    # np.isin() only agrees with Python membership test when both sides hold
+    # values of the same family - other cases are checked element by element
+    if isinstance(other, (set, frozenset, list, tuple)) and (
+        (column.dtype.kind == "U" and all(isinstance(e, str) for e in other))
+        or (column.dtype.kind in "iu" and all(isinstance(e, int) for e in other))
+    ):
+        return np.isin(column, list(other))
+    return _elementwise(lambda a, b: a in b)(column, other)
+
+
+def _numeric(
+    operator: Callable[[Any, Any], bool],
+) -> Callable[[np.ndarray, Any], np.ndarray]:
+    elementwise_operator = _elementwise(operator)
+
+    def apply(column: np.ndarray, other: Any) -> np.ndarray:
+        # NumPy would broadcast sequences (and arrays of any shape) against the
+        # column, while Python compares each value against the whole object
+        if isinstance(other, (int, float, np.number)):
+            return np.asarray(operator(column, other), dtype=bool)
+        return elementwise_operator(column, other)
+
+    return apply
+
+
+VECTORIZED_BINARY_OPERATORS = {
+    "==": _equals,
+    "(Number) ==": _numeric(lambda a, b: a == b),
+    "(Number) !=": _numeric(lambda a, b: a != b),
+    "!=": lambda a, b: ~_equals(a, b),
+    "(Number) >": _numeric(lambda a, b: a > b),
+    "(Number) >=": _numeric(lambda a, b: a >= b),
+    "(Number) <": _numeric(lambda a, b: a < b),
+    "(Number) <=": _numeric(lambda a, b: a <= b),
+    "(String) startsWith": _elementwise(lambda a, b: a.startswith(b)),
+    "(String) endsWith": _elementwise(lambda a, b: a.endswith(b)),
+    "(String) contains": _elementwise(lambda a, b: b in a),
+    "in (Sequence)": _is_in,
+}
+
+POINT_PROPERTIES_EXTRACTORS = {
+    DetectionsProperty.CENTER: lambda detections: detections.xyxy[:, :2]
+    + (detections.xyxy[:, 2:] - detections.xyxy[:, :2]) / 2,
+}
+
+VECTORIZED_POINT_OPERATORS = {
+    "(Detection) in zone": are_points_in_zone,
+}
+
+# operations which yield different value on each call - operand using them
+# must be resolved separately for each detection, as in row-by-row evaluation
+NON_DETERMINISTIC_OPERATIONS = {"RandomNumber"}
+
+VECTORIZED_STATEMENTS_COMBINERS = {
+    StatementsGroupsOperator.AND: np.logical_and,
+    StatementsGroupsOperator.OR: np.logical_or,
+}
+
+
+class VectorizedPredicate:
+    """
+    Filtering predicate that can be evaluated against the whole `sv.Detections`
+    at once, yielding boolean mask of detections to keep. Calling the object
+    behaves exactly as the row-by-row function built by the evaluation engine.
+    """
+
+    def __init__(
+        self,
+        row_function: Callable[[Dict[str, T]], bool],
+        mask_function: Callable[[Dict[str, Any]], MaskFunction],
+    ):
+        self._row_function = row_function
+        self._mask_function = mask_function
+
+    def __call__(self, values: Dict[str, T]) -> bool:
+        return self._row_function(values)
+
+    def evaluate(
+        self, detections: sv.Detections, global_parameters: Dict[str, Any]
+    ) -> np.ndarray:
+        if len(detections) == 0:
+            return np.zeros((0,), dtype=bool)
+        return self._mask_function(global_parameters)(detections)
+
+
+def build_vectorized_eval_function(
+    definition: Union[BinaryStatement, UnaryStatement, StatementGroup],
+    execution_context: str = "<root>",
+) -> Optional[Callable[[Dict[str, Any]], MaskFunction]]:
+    """
+    Returns function which resolves operands of the definition against global
+    parameters and yields function computing boolean mask over `sv.Detections`.
+    None is returned if the definition cannot be evaluated column-wise - in that
+    case the caller is expected to fall back to row-by-row evaluation.
+    """
+    if isinstance(definition, BinaryStatement):
+        return build_vectorized_binary_statement(
+            definition, execution_context=execution_context
+        )
+    if isinstance(definition, UnaryStatement):
+        return None
+    if definition.operator not in VECTORIZED_STATEMENTS_COMBINERS:
+        return None
+    statements_functions = []
+    for statement_id, statement in enumerate(definition.statements):
+        statement_execution_context = f"{execution_context}.statements[{statement_id}]"
+        statement_function = build_vectorized_eval_function(
+            statement, execution_context=statement_execution_context
+        )
+        if statement_function is None:
+            return None
+        statements_functions.append(statement_function)
+    return partial(
+        prepare_vectorized_compound_eval,
+        statements_functions=statements_functions,
+        operator=definition.operator,
+    )
+
+
+def build_vectorized_binary_statement(
+    definition: BinaryStatement,
+    execution_context: str,
+) -> Optional[Callable[[Dict[str, Any]], MaskFunction]]:
+    detections_property = _get_extracted_detections_property(
+        operand=definition.left_operand
+    )
+    if detections_property in PROPERTIES_EXTRACTORS_ARRAY:
+        extractors, operators = PROPERTIES_EXTRACTORS_ARRAY, VECTORIZED_BINARY_OPERATORS
+    elif detections_property in POINT_PROPERTIES_EXTRACTORS:
+        extractors, operators = POINT_PROPERTIES_EXTRACTORS, VECTORIZED_POINT_OPERATORS
+    else:
+        return None
+    if definition.comparator.type not in operators:
+        return None
+    operator_parameters_names = [
+        t for t in type(definition.comparator).model_fields if t != TYPE_PARAMETER_NAME
+    ]
+    if operator_parameters_names:
+        return None
+    if _depends_on_evaluated_detection(operand=definition.right_operand):
+        return None
+    if _contains_non_deterministic_operation(
+        operations=definition.right_operand.operations
+    ):
+        return None
+    right_operand_builder = create_operand_builder(
+        definition=definition.right_operand, execution_context=execution_context
+    )
+    return partial(
+        prepare_vectorized_binary_eval,
+        column_extractor=extractors[detections_property],
+        operator=operators[definition.comparator.type],
+        right_operand_builder=right_operand_builder,
+        negate=definition.negate,
+        operation_type=definition.type,
+        execution_context=execution_context,
+    )
+
+
+def _get_extracted_detections_property(
+    operand: Union[StaticOperand, DynamicOperand],
+) -> Optional[DetectionsProperty]:
+    if not isinstance(operand, DynamicOperand):
+        return None
+    if operand.operand_name != DEFAULT_OPERAND_NAME or len(operand.operations) != 1:
+        return None
+    operation = operand.operations[0]
+    if not isinstance(operation, ExtractDetectionProperty):
+        return None
+    return operation.property_name
+
+
+def _depends_on_evaluated_detection(
+    operand: Union[StaticOperand, DynamicOperand],
+) -> bool:
+    return (
+        isinstance(operand, DynamicOperand)
+        and operand.operand_name == DEFAULT_OPERAND_NAME
+    )
+
+
+def _contains_non_deterministic_operation(
+    operations: List[OperationDefinition],
+) -> bool:
+    for operation in operations:
+        if operation.type in NON_DETERMINISTIC_OPERATIONS:
+            return True
+        nested_operations = getattr(operation, "operations", [])
+        if _contains_non_deterministic_operation(operations=nested_operations):
+            return True
+    return False
+
+
+def prepare_vectorized_binary_eval(
+    global_parameters: Dict[str, Any],
+    column_extractor: Callable[[sv.Detections], np.ndarray],
+    operator: Callable[[np.ndarray, Any], np.ndarray],
+    right_operand_builder: Callable[[Dict[str, T]], Any],
+    negate: bool,
+    operation_type: str,
+    execution_context: str,
+) -> MaskFunction:
+    with _wrap_evaluation_errors(
+        operation_type=operation_type, execution_context=execution_context
+    ):
+        right_operand = right_operand_builder(global_parameters)
+    return partial(
+        vectorized_binary_eval,
+        column_extractor=column_extractor,
+        operator=operator,
+        right_operand=right_operand,
+        negate=negate,
+        operation_type=operation_type,
+        execution_context=execution_context,
+    )
+
+
+def vectorized_binary_eval(
+    detections: sv.Detections,
+    column_extractor: Callable[[sv.Detections], np.ndarray],
+    operator: Callable[[np.ndarray, Any], np.ndarray],
+    right_operand: Any,
+    negate: bool,
+    operation_type: str,
+    execution_context: str,
+) -> np.ndarray:
+    with _wrap_evaluation_errors(
+        operation_type=operation_type, execution_context=execution_context
+    ):
+        column = column_extractor(detections)
+        if column.dtype.kind == "f":
+            # row-by-row evaluation compares Python floats, NumPy would compare
+            # float32 columns against Python float in float32 precision
+            column = column.astype(np.float64, copy=False)
+        result = np.asarray(operator(column, right_operand), dtype=bool)
+        if result.shape != (len(detections),):
+            raise ValueError(
+                f"Could not compare detections property with value: {right_operand}"
+            )
+        if negate:
+            result = ~result
+        return result
+
+
+@contextmanager
+def _wrap_evaluation_errors(
+    operation_type: str, execution_context: str
+) -> Generator[None, None, None]:
+    try:
+        yield
+    except UndeclaredSymbolError as error:
+        raise UndeclaredSymbolError(
+            public_message=f"Attempted to execute evaluation of type: {operation_type} in context {execution_context}, "
+            f"but encountered error: {error.public_message}",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+        ) from error
+    except RoboflowQueryLanguageError as error:
+        raise error
+    except Exception as error:
+        raise EvaluationEngineError(
+            public_message=f"Attempted to execute evaluation of type: {operation_type} in context {execution_context}, "
+            f"but encountered error: {error}",
+            context=f"step_execution | roboflow_query_language_evaluation | {execution_context}",
+            inner_error=error,
+        ) from error
+
+
+def prepare_vectorized_compound_eval(
+    global_parameters: Dict[str, Any],
+    statements_functions: List[Callable[[Dict[str, Any]], MaskFunction]],
+    operator: StatementsGroupsOperator,
+) -> MaskFunction:
+    # operands of all statements are resolved upfront - such that invalid
+    # operand is reported regardless of statements being short-circuited
+    return partial(
+        vectorized_compound_eval,
+        statements_functions=[fun(global_parameters) for fun in statements_functions],
+        operator=operator,
+    )
+
+
+def vectorized_compound_eval(
+    detections: sv.Detections,
+    statements_functions: List[MaskFunction],
+    operator: StatementsGroupsOperator,
+) -> np.ndarray:
+    operator_fun = VECTORIZED_STATEMENTS_COMBINERS[operator]
+    result = statements_functions[0](detections)
+    for fun in statements_functions[1:]:
+        # outcome of the group is decided for all detections - remaining
+        # statements would not change the result
+        undecided = result if operator is StatementsGroupsOperator.AND else ~result
+        if not undecided.any():
+            break
+        result = operator_fun(result, fun(detections))
+    return result
@@ -161,11 +161,24 @@ def build_detections_filter_operation(
     from inference.core.workflows.core_steps.common.query_language.evaluation_engine.core import (
         build_eval_function,
     )
+    from inference.core.workflows.core_steps.common.query_language.evaluation_engine.vectorized import (
+        VectorizedPredicate,
+        build_vectorized_eval_function,
+    )
 
     filtering_fun = build_eval_function(
         definition=definition.filter_operation,
         execution_context=execution_context,
     )
+    mask_fun = build_vectorized_eval_function(
+        definition=definition.filter_operation,
+        execution_context=execution_context,
+    )
+    if mask_fun is not None:
+        filtering_fun = VectorizedPredicate(
+            row_function=filtering_fun,
+            mask_function=mask_fun,
+        )
     return partial(filter_detections, filtering_fun=filtering_fun)
 
 
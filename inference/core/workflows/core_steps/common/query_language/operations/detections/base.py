@@ -1,4 +1,7 @@
-from copy import copy, deepcopy
+import dataclasses
+from collections import ChainMap
+from copy import deepcopy
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Union
 
 import numpy as np
@@ -25,17 +28,26 @@ from inference.core.workflows.core_steps.common.serializers import (
     serialise_sv_detections,
 )
 
-PROPERTIES_EXTRACTORS = {
-    DetectionsProperty.CONFIDENCE: lambda detections: detections.confidence.tolist(),
+SELECT_BY_INDICES_KEEP_FRACTION = 0.5
+
+PROPERTIES_EXTRACTORS_ARRAY = {
+    DetectionsProperty.CONFIDENCE: lambda detections: detections.confidence,
     DetectionsProperty.CLASS_NAME: lambda detections: detections.data.get(
         "class_name", np.array([], dtype=str)
-    ).tolist(),
-    DetectionsProperty.X_MIN: lambda detections: detections.xyxy[:, 0].tolist(),
-    DetectionsProperty.Y_MIN: lambda detections: detections.xyxy[:, 1].tolist(),
-    DetectionsProperty.X_MAX: lambda detections: detections.xyxy[:, 2].tolist(),
-    DetectionsProperty.Y_MAX: lambda detections: detections.xyxy[:, 3].tolist(),
-    DetectionsProperty.CLASS_ID: lambda detections: detections.class_id.tolist(),
-    DetectionsProperty.SIZE: lambda detections: detections.box_area.tolist(),
+    ),
+    DetectionsProperty.X_MIN: lambda detections: detections.xyxy[:, 0],
+    DetectionsProperty.Y_MIN: lambda detections: detections.xyxy[:, 1],
+    DetectionsProperty.X_MAX: lambda detections: detections.xyxy[:, 2],
+    DetectionsProperty.Y_MAX: lambda detections: detections.xyxy[:, 3],
+    DetectionsProperty.CLASS_ID: lambda detections: detections.class_id,
+    DetectionsProperty.SIZE: lambda detections: detections.box_area,
+}
+
+PROPERTIES_EXTRACTORS = {
+    property_name: lambda detections, extractor=extractor: extractor(
+        detections
+    ).tolist()
+    for property_name, extractor in PROPERTIES_EXTRACTORS_ARRAY.items()
 }
 
 
@@ -67,13 +79,38 @@ def filter_detections(
             f"got {value_as_str} of type {type(detections)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
-    local_parameters = copy(global_parameters)
-    result = []
-    for detection in detections:
-        local_parameters[DEFAULT_OPERAND_NAME] = detection
-        should_stay = filtering_fun(local_parameters)
-        result.append(should_stay)
-    return detections[result]
+    evaluate_mask = getattr(filtering_fun, "evaluate", None)
+    if evaluate_mask is not None:
+        # predicate compiled into column-wise form - see VectorizedPredicate
+        return _select_detections_by_mask(
+            detections=detections,
+            mask=evaluate_mask(detections, global_parameters),
+        )
+    # detection is exposed through front mapping, so global parameters do not
+    # need to be copied
+    detection_parameters = {DEFAULT_OPERAND_NAME: None}
+    local_parameters = ChainMap(detection_parameters, global_parameters)
+
+    def evaluate_detection(detection: tuple) -> bool:
+        detection_parameters[DEFAULT_OPERAND_NAME] = detection
+        return filtering_fun(local_parameters)
+
+    mask = np.fromiter(
+        (evaluate_detection(detection) for detection in detections),
+        dtype=bool,
+        count=len(detections),
+    )
+    return _select_detections_by_mask(detections=detections, mask=mask)
+
+
+def _select_detections_by_mask(
+    detections: sv.Detections, mask: np.ndarray
+) -> sv.Detections:
+    # for selective filters gathering by integer indices is cheaper than
+    # boolean indexing, which has to scan the mask for each indexed field
+    if np.count_nonzero(mask) < SELECT_BY_INDICES_KEEP_FRACTION * mask.size:
+        return detections[np.flatnonzero(mask)]
+    return detections[mask]
 
 
 def offset_detections(
@@ -86,9 +123,14 @@ def offset_detections(
             f"got {value_as_str} of type {type(value)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
-    detections_copy = deepcopy(value)
-    detections_copy.xyxy += [-offset_x / 2, -offset_y / 2, offset_x / 2, offset_y / 2]
-    return detections_copy
+    if offset_x == 0 and offset_y == 0:
+        return _replace_detections_xyxy(detections=value, xyxy=value.xyxy)
+    xyxy_delta = _get_offset_xyxy_delta(
+        offset_x=offset_x,
+        offset_y=offset_y,
+        dtype=_get_xyxy_delta_dtype(detections=value),
+    )
+    return _replace_detections_xyxy(detections=value, xyxy=value.xyxy + xyxy_delta)
 
 
 def shift_detections(value: Any, shift_x: int, shift_y: int, **kwargs) -> sv.Detections:
@@ -99,9 +141,47 @@ def shift_detections(value: Any, shift_x: int, shift_y: int, **kwargs) -> sv.Det
             f"got {value_as_str} of type {type(value)}",
             context="step_execution | roboflow_query_language_evaluation",
         )
-    detections_copy = deepcopy(value)
-    detections_copy.xyxy += [shift_x, shift_y, shift_x, shift_y]
-    return detections_copy
+    if shift_x == 0 and shift_y == 0:
+        return _replace_detections_xyxy(detections=value, xyxy=value.xyxy)
+    xyxy_delta = _get_shift_xyxy_delta(
+        shift_x=shift_x,
+        shift_y=shift_y,
+        dtype=value.xyxy.dtype,
+    )
+    return _replace_detections_xyxy(detections=value, xyxy=value.xyxy + xyxy_delta)
+
+
+@lru_cache(maxsize=64)
+def _get_offset_xyxy_delta(offset_x: int, offset_y: int, dtype: np.dtype) -> np.ndarray:
+    half_x, half_y = offset_x * 0.5, offset_y * 0.5
+    return _as_read_only(np.array([-half_x, -half_y, half_x, half_y], dtype=dtype))
+
+
+@lru_cache(maxsize=64)
+def _get_shift_xyxy_delta(shift_x: int, shift_y: int, dtype: np.dtype) -> np.ndarray:
+    return _as_read_only(np.array([shift_x, shift_y, shift_x, shift_y], dtype=dtype))
+
+
+def _as_read_only(array: np.ndarray) -> np.ndarray:
+    # cached arrays are shared between calls and must not be modified in place
+    array.flags.writeable = False
+    return array
+
+
+def _get_xyxy_delta_dtype(detections: sv.Detections) -> np.dtype:
+    # offset moves box edges by half of its value, so integer boxes need floats
+    if np.issubdtype(detections.xyxy.dtype, np.floating):
+        return detections.xyxy.dtype
+    return np.dtype(np.float64)
+
+
+def _replace_detections_xyxy(
+    detections: sv.Detections, xyxy: np.ndarray
+) -> sv.Detections:
+    # only boxes change - remaining fields are not mutated, so arrays (masks in
+    # particular) are shared with input; `data` dict is copied shallowly so that
+    # keys added to output later on do not leak into input
+    return dataclasses.replace(detections, xyxy=xyxy, data=dict(detections.data))
 
 
 def select_top_confidence_detection(detections: sv.Detections) -> sv.Detections:
@@ -1,4 +1,4 @@
-from typing import List, Literal, Optional, Type, TypeVar, Union
+from typing import Generator, List, Literal, Optional, Tuple, Type, TypeVar, Union
 
 import numpy as np
 import supervision as sv
@@ -186,28 +186,35 @@ class SegmentAnything2BlockV1(WorkflowBlock):
         multimask_output: bool,
     ) -> BlockResult:
 
-        predictions = []
         if boxes is None:
             boxes = [None] * len(images)
 
+        inference_requests = []
+        prompts_metadata = []
         for single_image, boxes_for_image in zip(images, boxes):
             prompt_class_ids: List[Optional[int]] = []
             prompt_class_names: List[str] = []
             prompt_detection_ids: List[Optional[str]] = []
 
             prompts = []
-            if boxes_for_image is not None:
-                for xyxy, _, confidence, class_id, _, bbox_data in boxes_for_image:
-                    x1, y1, x2, y2 = xyxy
-                    prompt_class_ids.append(class_id)
-                    prompt_class_names.append(bbox_data[DETECTIONS_CLASS_NAME_FIELD])
-                    prompt_detection_ids.append(bbox_data[DETECTION_ID_FIELD])
-                    width = x2 - x1
-                    height = y2 - y1
-                    cx = x1 + width / 2
-                    cy = y1 + height / 2
-                    prompt = Sam2Prompt(
-                        box=Box(
+            # empty sv.Detections may come without `data` fields - SAM2 is then
+            # run without prompts
+            if boxes_for_image is not None and len(boxes_for_image) > 0:
+                xyxy = boxes_for_image.xyxy
+                boxes_sizes = xyxy[:, 2:] - xyxy[:, :2]
+                boxes_centers = (xyxy[:, :2] + xyxy[:, 2:]) * 0.5
+                prompt_class_ids = boxes_for_image.class_id.tolist()
+                prompt_class_names = boxes_for_image.data[
+                    DETECTIONS_CLASS_NAME_FIELD
+                ].tolist()
+                prompt_detection_ids = boxes_for_image.data[DETECTION_ID_FIELD].tolist()
+                for (cx, cy), (width, height) in zip(
+                    boxes_centers.tolist(), boxes_sizes.tolist()
+                ):
+                    # values are plain floats derived from validated detections,
+                    # so pydantic validation can be skipped in this loop
+                    prompt = Sam2Prompt.model_construct(
+                        box=Box.model_construct(
                             x=cx,
                             y=cy,
                             width=width,
@@ -215,25 +222,37 @@ class SegmentAnything2BlockV1(WorkflowBlock):
                         )
                     )
                     prompts.append(prompt)
-            inference_request = Sam2SegmentationRequest(
-                image=single_image.to_inference_format(numpy_preferred=True),
-                sam2_version_id=version,
-                api_key=self._api_key,
-                source="workflow-execution",
-                prompts=Sam2PromptSet(prompts=prompts),
-                threshold=threshold,
-                multimask_output=multimask_output,
+            inference_requests.append(
+                Sam2SegmentationRequest(
+                    image=single_image.to_inference_format(numpy_preferred=True),
+                    sam2_version_id=version,
+                    api_key=self._api_key,
+                    source="workflow-execution",
+                    prompts=Sam2PromptSet.model_construct(prompts=prompts),
+                    threshold=threshold,
+                    multimask_output=multimask_output,
+                )
+            )
+            prompts_metadata.append(
+                (prompt_class_ids, prompt_class_names, prompt_detection_ids)
             )
+
+        predictions = []
+        if inference_requests:
+            # all requests in the batch share model version and api key, so
+            # the model is loaded once rather than for each image
             sam_model_id = load_core_model(
                 model_manager=self._model_manager,
-                inference_request=inference_request,
+                inference_request=inference_requests[0],
                 core_model="sam2",
             )
-
+        for single_image, inference_request, metadata in zip(
+            images, inference_requests, prompts_metadata
+        ):
+            prompt_class_ids, prompt_class_names, prompt_detection_ids = metadata
             sam2_segmentation_response = self._model_manager.infer_from_request_sync(
                 sam_model_id, inference_request
             )
-
             prediction = convert_sam2_segmentation_response_to_inference_instances_seg_response(
                 sam2_segmentation_predictions=sam2_segmentation_response.predictions,
                 image=single_image,
@@ -242,11 +261,14 @@ class SegmentAnything2BlockV1(WorkflowBlock):
                 prompt_detection_ids=prompt_detection_ids,
                 threshold=threshold,
             )
-            predictions.append(prediction)
+            # converting each image right away, so that polygons of the whole
+            # batch are never held as pydantic objects and dicts at the same time
+            predictions.extend(
+                convert_inference_detections_batch_to_sv_detections(
+                    [prediction.model_dump(by_alias=True, exclude_none=True)]
+                )
+            )
 
-        predictions = [
-            e.model_dump(by_alias=True, exclude_none=True) for e in predictions
-        ]
         return self._post_process_result(
             images=images,
             predictions=predictions,
@@ -255,9 +277,8 @@ class SegmentAnything2BlockV1(WorkflowBlock):
     def _post_process_result(
         self,
         images: Batch[WorkflowImageData],
-        predictions: List[dict],
+        predictions: List[sv.Detections],
     ) -> BlockResult:
-        predictions = convert_inference_detections_batch_to_sv_detections(predictions)
         predictions = attach_prediction_type_info_to_sv_detections_batch(
             predictions=predictions,
             prediction_type="instance-segmentation",
@@ -279,50 +300,68 @@ def convert_sam2_segmentation_response_to_inference_instances_seg_response(
 ) -> InstanceSegmentationInferenceResponse:
     image_width = image.numpy_image.shape[1]
     image_height = image.numpy_image.shape[0]
-    predictions = []
     if len(prompt_class_ids) == 0:
-        prompt_class_ids = [0 for _ in range(len(sam2_segmentation_predictions))]
-        prompt_class_names = [
-            "foreground" for _ in range(len(sam2_segmentation_predictions))
-        ]
-        prompt_detection_ids = [None for _ in range(len(sam2_segmentation_predictions))]
+        predictions_number = len(sam2_segmentation_predictions)
+        prompt_class_ids = [0] * predictions_number
+        prompt_class_names = ["foreground"] * predictions_number
+        prompt_detection_ids = [None] * predictions_number
+    predictions = list(
+        generate_instance_segmentation_predictions(
+            sam2_segmentation_predictions=sam2_segmentation_predictions,
+            prompt_class_ids=prompt_class_ids,
+            prompt_class_names=prompt_class_names,
+            prompt_detection_ids=prompt_detection_ids,
+            threshold=threshold,
+        )
+    )
+    return InstanceSegmentationInferenceResponse(
+        predictions=predictions,
+        image=InferenceResponseImage(width=image_width, height=image_height),
+    )
+
+
+def generate_instance_segmentation_predictions(
+    sam2_segmentation_predictions: List[Sam2SegmentationPrediction],
+    prompt_class_ids: List[Optional[int]],
+    prompt_class_names: List[Optional[str]],
+    prompt_detection_ids: List[Optional[str]],
+    threshold: float,
+) -> Generator[InstanceSegmentationPrediction, None, None]:
     for prediction, class_id, class_name, detection_id in zip(
         sam2_segmentation_predictions,
         prompt_class_ids,
         prompt_class_names,
         prompt_detection_ids,
     ):
+        if prediction.confidence < threshold:
+            # skipping masks below threshold
+            continue
         for mask in prediction.masks:
             if len(mask) < 3:
                 # skipping empty masks
                 continue
-            if prediction.confidence < threshold:
-                # skipping maks below threshold
-                continue
-            x_coords = [coord[0] for coord in mask]
-            y_coords = [coord[1] for coord in mask]
-            min_x = np.min(x_coords)
-            max_x = np.max(x_coords)
-            min_y = np.min(y_coords)
-            max_y = np.max(y_coords)
-            center_x = (min_x + max_x) / 2
-            center_y = (min_y + max_y) / 2
-            predictions.append(
-                InstanceSegmentationPrediction(
-                    **{
-                        "x": center_x,
-                        "y": center_y,
-                        "width": max_x - min_x,
-                        "height": max_y - min_y,
-                        "points": [Point(x=point[0], y=point[1]) for point in mask],
-                        "confidence": prediction.confidence,
-                        "class": class_name,
-                        "class_id": class_id,
-                        "parent_id": detection_id,
-                    }
-                )
+            polygon = np.ascontiguousarray(mask, dtype=np.float32)
+            center_x, center_y, width, height = get_polygon_bounding_box(
+                polygon=polygon
             )
-    return InstanceSegmentationInferenceResponse(
-        predictions=predictions,
-        image=InferenceResponseImage(width=image_width, height=image_height),
-    )
+            yield InstanceSegmentationPrediction(
+                **{
+                    "x": center_x,
+                    "y": center_y,
+                    "width": width,
+                    "height": height,
+                    "points": [
+                        Point.model_construct(x=x, y=y) for x, y in polygon.tolist()
+                    ],
+                    "confidence": prediction.confidence,
+                    "class": class_name,
+                    "class_id": class_id,
+                    "parent_id": detection_id,
+                }
+            )
+
+
+def get_polygon_bounding_box(polygon: np.ndarray) -> Tuple[float, float, float, float]:
+    min_x, min_y = polygon.min(axis=0).tolist()
+    max_x, max_y = polygon.max(axis=0).tolist()
+    return (min_x + max_x) * 0.5, (min_y + max_y) * 0.5, max_x - min_x, max_y - min_y
@@ -8,6 +8,8 @@ from inference.core.workflows.core_steps.common.query_language.entities.operatio
     OperationDefinition,
 )
 from inference.core.workflows.core_steps.transformations.detections_transformation.v1 import (
+    CompiledOperations,
+    compile_operations,
     execute_transformation,
 )
 from inference.core.workflows.execution_engine.entities.base import (
@@ -119,6 +121,9 @@ class BlockManifest(WorkflowBlockManifest):
 
 class DetectionsFilterBlockV1(WorkflowBlock):
 
+    def __init__(self):
+        self._compiled_operations: Optional[CompiledOperations] = None
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -129,8 +134,14 @@ class DetectionsFilterBlockV1(WorkflowBlock):
         operations: List[OperationDefinition],
         operations_parameters: Dict[str, Any],
     ) -> BlockResult:
+        compiled_operations = compile_operations(
+            operations=operations,
+            compiled_operations=self._compiled_operations,
+        )
+        self._compiled_operations = compiled_operations
         return execute_transformation(
             predictions=predictions,
             operations=operations,
             operations_parameters=operations_parameters,
+            operations_chain=compiled_operations[1],
         )
@@ -1,5 +1,5 @@
 from copy import copy
-from typing import Any, Dict, List, Literal, Optional, Type, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Type, Union
 
 import supervision as sv
 from pydantic import ConfigDict, Field
@@ -136,8 +136,16 @@ class BlockManifest(WorkflowBlockManifest):
         return ">=1.3.0,<2.0.0"
 
 
+CompiledOperations = Tuple[
+    List[OperationDefinition], Callable[[Any, Dict[str, Any]], Any]
+]
+
+
 class DetectionsTransformationBlockV1(WorkflowBlock):
 
+    def __init__(self):
+        self._compiled_operations: Optional[CompiledOperations] = None
+
     @classmethod
     def get_manifest(cls) -> Type[WorkflowBlockManifest]:
         return BlockManifest
@@ -148,24 +156,43 @@ class DetectionsTransformationBlockV1(WorkflowBlock):
         operations: List[OperationDefinition],
         operations_parameters: Dict[str, Any],
     ) -> BlockResult:
+        compiled_operations = compile_operations(
+            operations=operations,
+            compiled_operations=self._compiled_operations,
+        )
+        self._compiled_operations = compiled_operations
         return execute_transformation(
             predictions=predictions,
             operations=operations,
             operations_parameters=operations_parameters,
+            operations_chain=compiled_operations[1],
         )
 
 
+def compile_operations(
+    operations: List[OperationDefinition],
+    compiled_operations: Optional[CompiledOperations],
+) -> CompiledOperations:
+    # operations are static manifest value, so Execution Engine passes the very
+    # same object on each run - the chain only needs to be built once
+    if compiled_operations is not None and compiled_operations[0] is operations:
+        return compiled_operations
+    return operations, build_operations_chain(operations=operations)
+
+
 def execute_transformation(
     predictions: Batch[sv.Detections],
     operations: List[OperationDefinition],
     operations_parameters: Dict[str, Any],
+    operations_chain: Optional[Callable[[Any, Dict[str, Any]], Any]] = None,
 ) -> BlockResult:
     if DEFAULT_OPERAND_NAME in operations_parameters:
         raise ValueError(
             f"Detected reserved parameter name: {DEFAULT_OPERAND_NAME} declared in `operations_parameters` "
             f"of `DetectionsTransformation` block."
         )
-    operations_chain = build_operations_chain(operations=operations)
+    if operations_chain is None:
+        operations_chain = build_operations_chain(operations=operations)
     batch_parameters = grab_batch_parameters(
         operations_parameters=operations_parameters,
         main_batch_size=len(predictions),
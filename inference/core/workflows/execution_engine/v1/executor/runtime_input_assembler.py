@@ -20,6 +20,10 @@ def assemble_runtime_parameters(
     prevent_local_images_loading: bool = False,
     profiler: Optional[WorkflowsProfiler] = None,
 ) -> Dict[str, Any]:
+    ensure_batch_oriented_inputs_provided(
+        runtime_parameters=runtime_parameters,
+        defined_inputs=defined_inputs,
+    )
     input_batch_size = determine_input_batch_size(
         runtime_parameters=runtime_parameters,
         defined_inputs=defined_inputs,
@@ -42,6 +46,19 @@ def assemble_runtime_parameters(
     return runtime_parameters
 
 
+def ensure_batch_oriented_inputs_provided(
+    runtime_parameters: Dict[str, Any], defined_inputs: List[InputType]
+) -> None:
+    # checked upfront, such that missing input is reported before any of the
+    # remaining inputs gets deserialized (which may involve decoding or download)
+    for defined_input in defined_inputs:
+        if (
+            defined_input.is_batch_oriented()
+            and runtime_parameters.get(defined_input.name) is None
+        ):
+            raise _missing_batch_oriented_input_error(defined_input=defined_input)
+
+
 def determine_input_batch_size(
     runtime_parameters: Dict[str, Any], defined_inputs: List[InputType]
 ) -> int:
@@ -62,12 +79,7 @@ def assemble_batch_oriented_input(
     prevent_local_images_loading: bool,
 ) -> List[Any]:
     if value is None:
-        raise RuntimeInputError(
-            public_message=f"Detected runtime parameter `{defined_input.name}` defined as "
-            f"`{defined_input.type}` (of kind `{[_get_kind_name(k) for k in defined_input.kind]}`), "
-            f"but value is not provided.",
-            context="workflow_execution | runtime_input_validation",
-        )
+        raise _missing_batch_oriented_input_error(defined_input=defined_input)
     if not isinstance(value, list):
         result = [
             assemble_single_element_of_batch_oriented_input(
@@ -101,6 +113,15 @@ def assemble_batch_oriented_input(
     return result
 
 
+def _missing_batch_oriented_input_error(defined_input: InputType) -> RuntimeInputError:
+    return RuntimeInputError(
+        public_message=f"Detected runtime parameter `{defined_input.name}` defined as "
+        f"`{defined_input.type}` (of kind `{[_get_kind_name(k) for k in defined_input.kind]}`), "
+        f"but value is not provided.",
+        context="workflow_execution | runtime_input_validation",
+    )
+
+
 def assemble_nested_batch_oriented_input(
     current_depth: int,
     defined_input: InputType,
@@ -16,6 +16,15 @@ def roboflow_api_key() -> str:
 
 @pytest.fixture(scope="function")
 def model_manager() -> ModelManager:
+    return create_model_manager()
+
+
+@pytest.fixture(scope="module")
+def module_model_manager() -> ModelManager:
+    return create_model_manager()
+
+
+def create_model_manager() -> ModelManager:
     model_registry = RoboflowModelRegistry(ROBOFLOW_MODEL_TYPES)
     model_manager = ModelManager(model_registry=model_registry)
     return WithFixedSizeCache(model_manager, max_size=MAX_ACTIVE_MODELS)
@@ -111,6 +111,22 @@ EXPECTED_OBJECT_DETECTION_CONFIDENCES = np.array(
 )
 
 
+@pytest.fixture(scope="module")
+def filtering_execution_engine(module_model_manager: ModelManager) -> ExecutionEngine:
+    # workflow definition and init parameters are the same for all tests in
+    # this module, so the workflow is compiled once
+    workflow_init_parameters = {
+        "workflows_core.model_manager": module_model_manager,
+        "workflows_core.api_key": None,
+        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
+    }
+    return ExecutionEngine.init(
+        workflow_definition=FILTERING_WORKFLOW,
+        init_parameters=workflow_init_parameters,
+        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
+    )
+
+
 @add_to_workflows_gallery(
     category="Workflows with data transformations",
     use_case_title="Workflow with detections filtering",
@@ -126,23 +142,11 @@ that is going to filter predictions based on:
     workflow_name_in_app="detections-filtering",
 )
 def test_filtering_workflow_when_minimal_valid_input_provided(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
     crowd_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
-    result = execution_engine.run(
+    result = filtering_execution_engine.run(
         runtime_parameters={
             "image": crowd_image,
             "model_id": "yolov8n-640",
@@ -153,37 +157,18 @@ def test_filtering_workflow_when_minimal_valid_input_provided(
     # then
     assert isinstance(result, list), "Expected result to be list"
     assert len(result) == 1, "Single image provided - single output expected"
-    detections: sv.Detections = result[0]["result"]["predictions"]
-    assert np.allclose(
-        detections.xyxy,
-        EXPECTED_OBJECT_DETECTION_BBOXES,
-        atol=1,
-    ), "Expected bboxes to match what was validated manually as workflow outcome"
-    assert np.allclose(
-        detections.confidence,
-        EXPECTED_OBJECT_DETECTION_CONFIDENCES,
-        atol=0.01,
-    ), "Expected confidences to match what was validated manually as workflow outcome"
+    _assert_detections_match_expected(
+        detections=result[0]["result"]["predictions"],
+        image_description="image",
+    )
 
 
 def test_filtering_workflow_when_batch_input_provided(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
     crowd_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
-    result = execution_engine.run(
+    result = filtering_execution_engine.run(
         runtime_parameters={
             "image": [crowd_image, crowd_image],
             "model_id": "yolov8n-640",
@@ -194,49 +179,23 @@ def test_filtering_workflow_when_batch_input_provided(
     # then
     assert isinstance(result, list), "Expected result to be list"
     assert len(result) == 2, "Two images provided - two outputs expected"
-    detections_1: sv.Detections = result[0]["result"]["predictions"]
-    detections_2: sv.Detections = result[1]["result"]["predictions"]
-    assert np.allclose(
-        detections_1.xyxy,
-        EXPECTED_OBJECT_DETECTION_BBOXES,
-        atol=1,
-    ), "Expected bboxes for first image to match what was validated manually as workflow outcome"
-    assert np.allclose(
-        detections_1.confidence,
-        EXPECTED_OBJECT_DETECTION_CONFIDENCES,
-        atol=0.01,
-    ), "Expected confidences for first image to match what was validated manually as workflow outcome"
-    assert np.allclose(
-        detections_2.xyxy,
-        EXPECTED_OBJECT_DETECTION_BBOXES,
-        atol=1,
-    ), "Expected bboxes for 2nd image to match what was validated manually as workflow outcome"
-    assert np.allclose(
-        detections_2.confidence,
-        EXPECTED_OBJECT_DETECTION_CONFIDENCES,
-        atol=0.01,
-    ), "Expected confidences for 2nd image to match what was validated manually as workflow outcome"
+    _assert_detections_match_expected(
+        detections=result[0]["result"]["predictions"],
+        image_description="first image",
+    )
+    _assert_detections_match_expected(
+        detections=result[1]["result"]["predictions"],
+        image_description="2nd image",
+    )
 
 
 def test_filtering_workflow_when_model_id_not_provided_in_input(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
     crowd_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
     with pytest.raises(RuntimeInputError):
-        _ = execution_engine.run(
+        _ = filtering_execution_engine.run(
             runtime_parameters={
                 "image": crowd_image,
             }
@@ -244,23 +203,11 @@ def test_filtering_workflow_when_model_id_not_provided_in_input(
 
 
 def test_filtering_workflow_when_image_not_provided_in_input(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
     with pytest.raises(RuntimeInputError):
-        _ = execution_engine.run(
+        _ = filtering_execution_engine.run(
             runtime_parameters={
                 "model_id": "yolov8n-640",
             }
@@ -268,24 +215,12 @@ def test_filtering_workflow_when_image_not_provided_in_input(
 
 
 def test_filtering_workflow_when_classes_not_provided(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
     crowd_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
     with pytest.raises(EvaluationEngineError):
-        _ = execution_engine.run(
+        _ = filtering_execution_engine.run(
             runtime_parameters={
                 "image": crowd_image,
                 "model_id": "yolov8n-640",
@@ -294,26 +229,30 @@ def test_filtering_workflow_when_classes_not_provided(
 
 
 def test_filtering_workflow_when_model_id_cannot_be_resolved_to_valid_model(
-    model_manager: ModelManager,
+    filtering_execution_engine: ExecutionEngine,
     crowd_image: np.ndarray,
 ) -> None:
-    # given
-    workflow_init_parameters = {
-        "workflows_core.model_manager": model_manager,
-        "workflows_core.api_key": None,
-        "workflows_core.step_execution_mode": StepExecutionMode.LOCAL,
-    }
-    execution_engine = ExecutionEngine.init(
-        workflow_definition=FILTERING_WORKFLOW,
-        init_parameters=workflow_init_parameters,
-        max_concurrent_steps=WORKFLOWS_MAX_CONCURRENT_STEPS,
-    )
-
     # when
     with pytest.raises(StepExecutionError):
-        _ = execution_engine.run(
+        _ = filtering_execution_engine.run(
             runtime_parameters={
                 "image": crowd_image,
                 "model_id": "invalid",
             }
         )
+
+
+def _assert_detections_match_expected(
+    detections: sv.Detections,
+    image_description: str,
+) -> None:
+    assert np.allclose(
+        detections.xyxy,
+        EXPECTED_OBJECT_DETECTION_BBOXES,
+        atol=1,
+    ), f"Expected bboxes for {image_description} to match what was validated manually as workflow outcome"
+    assert np.allclose(
+        detections.confidence,
+        EXPECTED_OBJECT_DETECTION_CONFIDENCES,
+        atol=0.01,
+    ), f"Expected confidences for {image_description} to match what was validated manually as workflow outcome"
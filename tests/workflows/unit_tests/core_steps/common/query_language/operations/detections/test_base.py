@@ -2,11 +2,16 @@ import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+)
 from inference.core.workflows.core_steps.common.query_language.errors import (
     InvalidInputTypeError,
     OperationError,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.detections.base import (
+    extract_detections_property,
+    filter_detections,
     rename_detections,
 )
 
@@ -178,3 +183,51 @@ def test_rename_detections_when_mapping_is_parametrised() -> None:
         "A",
         "B",
     ], "Expected to change with mapping"
+
+
+def test_extract_detections_property_when_list_requested() -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[0, 1, 2, 3], [4, 5, 6, 7]]),
+        class_id=np.array([10, 11]),
+    )
+
+    # when
+    result = extract_detections_property(
+        detections=detections,
+        property_name=DetectionsProperty.X_MAX,
+        execution_context="<root>",
+    )
+
+    # then
+    assert result == [2, 6]
+
+
+@pytest.mark.parametrize(
+    "kept_class_names, expected_xyxy",
+    [
+        ({"b"}, [[10, 10, 20, 20]]),
+        ({"a", "c"}, [[0, 0, 10, 10], [20, 20, 30, 30]]),
+        (set(), np.empty((0, 4)).tolist()),
+    ],
+)
+def test_filter_detections_when_row_function_provided(
+    kept_class_names: set, expected_xyxy: list
+) -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [10, 10, 20, 20], [20, 20, 30, 30]]),
+        class_id=np.array([0, 1, 2]),
+        data={"class_name": np.array(["a", "b", "c"])},
+    )
+
+    # when
+    result = filter_detections(
+        detections=detections,
+        filtering_fun=lambda values: values["_"][5]["class_name"] in kept_class_names,
+        global_parameters={},
+    )
+
+    # then
+    assert result.xyxy.tolist() == expected_xyxy
+    assert result.data["class_name"].tolist() == sorted(kept_class_names)
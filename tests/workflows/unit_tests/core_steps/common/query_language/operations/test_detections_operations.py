@@ -1,14 +1,32 @@
+from unittest import mock
+
 import numpy as np
 import pytest
 import supervision as sv
 
+from inference.core.workflows.core_steps.common.query_language.entities.enums import (
+    DetectionsProperty,
+    ImageProperty,
+)
 from inference.core.workflows.core_steps.common.query_language.errors import (
+    EvaluationEngineError,
     InvalidInputTypeError,
     OperationError,
+    UndeclaredSymbolError,
 )
 from inference.core.workflows.core_steps.common.query_language.operations.core import (
     execute_operations,
 )
+from inference.core.workflows.core_steps.common.query_language.operations.detections import (
+    base as detections_operations,
+)
+from inference.core.workflows.core_steps.common.query_language.operations.images import (
+    base as images_operations,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
 
 
 def test_detections_to_dictionary_when_invalid_input_is_provided() -> None:
@@ -86,3 +104,1060 @@ def test_detections_to_dictionary_when_malformed_input_is_provided() -> None:
     # when
     with pytest.raises(OperationError):
         _ = execute_operations(value=detections, operations=operations)
+
+
+def test_detections_filter_when_and_statement_group_provided() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {"type": "StaticOperand", "value": 10},
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={"classes": {"cat"}},
+    )
+
+    # then
+    assert np.allclose(result.xyxy, np.array([[0, 0, 6, 6]]))
+    assert result.data["class_name"].tolist() == ["cat"]
+
+
+def test_detections_filter_when_no_detection_passes_first_statement_of_and_group() -> (
+    None
+):
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {"type": "StaticOperand", "value": 10},
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 2, 2], [0, 0, 5, 5]]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+    size_extractor = mock.MagicMock(
+        wraps=detections_operations.PROPERTIES_EXTRACTORS_ARRAY[DetectionsProperty.SIZE]
+    )
+
+    # when
+    with mock.patch.dict(
+        detections_operations.PROPERTIES_EXTRACTORS_ARRAY,
+        {DetectionsProperty.SIZE: size_extractor},
+    ):
+        result = execute_operations(
+            value=detections,
+            operations=operations,
+            global_parameters={"classes": {"giraffe"}},
+        )
+
+    # then
+    assert len(result) == 0
+    size_extractor.assert_not_called()
+
+
+def test_detections_filter_when_short_circuited_statement_uses_undeclared_operand() -> (
+    None
+):
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "min_size",
+                        },
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    with pytest.raises(UndeclaredSymbolError):
+        _ = execute_operations(
+            value=detections,
+            operations=operations,
+            global_parameters={"classes": {"giraffe"}},
+        )
+
+
+def test_detections_filter_when_or_statement_group_provided() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "or",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {"type": "StaticOperand", "value": 10},
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={"classes": ["cat"]},
+    )
+
+    # then
+    assert result.class_id.tolist() == [0, 1, 0]
+    assert np.allclose(result.confidence, np.array([0.3, 0.4, 0.5]))
+
+
+def test_detections_filter_when_empty_detections_provided() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {"type": "StaticOperand", "value": 10},
+                    },
+                ],
+            },
+        }
+    ]
+
+    # when
+    result = execute_operations(
+        value=sv.Detections.empty(),
+        operations=operations,
+        global_parameters={},
+    )
+
+    # then
+    assert len(result) == 0
+
+
+def test_detections_filter_when_parameter_cannot_be_compared() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {"type": "StaticOperand", "value": 10},
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    with pytest.raises(EvaluationEngineError):
+        _ = execute_operations(
+            value=detections,
+            operations=operations,
+            global_parameters={"classes": None},
+        )
+
+
+def test_detections_filter_when_statement_cannot_be_vectorized() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    {
+                        "type": "UnaryStatement",
+                        "operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "operator": {"type": "Exists"},
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={},
+    )
+
+    # then
+    assert len(result) == 4
+
+
+def test_detections_offset_when_valid_input_is_provided() -> None:
+    # given
+    operations = [{"type": "DetectionsOffset", "offset_x": 10, "offset_y": 20}]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+    detections.mask = np.zeros((4, 8, 8), dtype=bool)
+
+    # when
+    result = execute_operations(value=detections, operations=operations)
+
+    # then
+    assert np.allclose(result.xyxy[0], np.array([-5, -10, 7, 12]))
+    assert np.allclose(
+        detections.xyxy[0], np.array([0, 0, 2, 2])
+    ), "Expected input not to be modified"
+    assert result.mask is detections.mask, "Expected not modified fields to be shared"
+    assert result.data["class_name"].tolist() == ["cat", "dog", "cat", "dog"]
+
+
+def test_detections_shift_when_valid_input_is_provided() -> None:
+    # given
+    operations = [{"type": "DetectionsShift", "shift_x": 10, "shift_y": 20}]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(value=detections, operations=operations)
+
+    # then
+    assert np.allclose(result.xyxy[1], np.array([10, 20, 15, 25]))
+    assert result.xyxy.dtype == detections.xyxy.dtype, "Expected integer boxes kept"
+    assert np.allclose(
+        detections.xyxy[1], np.array([0, 0, 5, 5])
+    ), "Expected input not to be modified"
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"type": "DetectionsOffset", "offset_x": 0, "offset_y": 0},
+        {"type": "DetectionsShift", "shift_x": 0, "shift_y": 0},
+    ],
+)
+def test_detections_offset_and_shift_when_no_change_requested(operation: dict) -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(value=detections, operations=[operation])
+
+    # then
+    assert result is not detections
+    assert np.array_equal(result.xyxy, detections.xyxy)
+    result["some"] = np.array([1, 2, 3, 4])
+    assert "some" not in detections.data, "Expected keys of output not to leak"
+
+
+@pytest.mark.parametrize(
+    "operation",
+    [
+        {"type": "DetectionsOffset", "offset_x": 3, "offset_y": 5},
+        {"type": "DetectionsShift", "shift_x": 3, "shift_y": 5},
+    ],
+)
+def test_detections_offset_and_shift_preserve_float32_boxes(operation: dict) -> None:
+    # given
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+    detections.xyxy = detections.xyxy.astype(np.float32)
+
+    # when
+    result = execute_operations(value=detections, operations=[operation])
+
+    # then
+    assert result.xyxy.dtype == np.float32, "Expected no upcasting of boxes"
+
+
+def test_detections_filter_when_detections_centers_checked_against_zone() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "center",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Detection) in zone"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "zone",
+                        },
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={"zone": [[1.5, 1.5], [4, 1.5], [4, 4], [1.5, 4]]},
+    )
+
+    # then
+    assert result.class_id.tolist() == [1, 0], "Expected 2nd and 3rd box to be kept"
+
+
+@pytest.mark.parametrize(
+    "property_name, values, expected_class_ids",
+    [
+        ("class_name", ["dog", "bird"], [1, 1]),
+        ("class_name", frozenset({"cat"}), [0, 0]),
+        ("class_name", {"cat", 1}, [0, 0]),
+        ("class_id", {1}, [1, 1]),
+        ("class_id", (0, "1"), [0, 0]),
+        ("class_id", [], []),
+    ],
+)
+def test_detections_filter_when_property_checked_against_sequence(
+    property_name: str, values: object, expected_class_ids: list
+) -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": property_name,
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "values",
+                        },
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={"values": values},
+    )
+
+    # then
+    assert result.class_id.tolist() == expected_class_ids
+
+
+def test_detections_filter_when_size_compared_against_fraction_of_image_size() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "class_name",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "in (Sequence)"},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "classes",
+                        },
+                    },
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "size",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {
+                            "type": "DynamicOperand",
+                            "operand_name": "image",
+                            "operations": [
+                                {
+                                    "type": "ExtractImageProperty",
+                                    "property_name": "size",
+                                },
+                                {"type": "Multiply", "other": 0.02},
+                            ],
+                        },
+                    },
+                ],
+            },
+        }
+    ]
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="some"),
+        numpy_image=np.zeros((20, 50, 3), dtype=np.uint8),
+    )
+    image_size_extractor = mock.MagicMock(
+        wraps=images_operations.PROPERTY_EXTRACTORS[ImageProperty.SIZE]
+    )
+    detections = sv.Detections(
+        xyxy=np.array(
+            [
+                [0, 0, 2, 2],
+                [0, 0, 5, 5],
+                [0, 0, 6, 6],
+                [0, 0, 1, 1],
+            ]
+        ),
+        class_id=np.array([0, 1, 0, 1]),
+        confidence=np.array([0.3, 0.4, 0.5, 0.6]),
+        data={"class_name": np.array(["cat", "dog", "cat", "dog"])},
+    )
+
+    # when
+    with mock.patch.dict(
+        images_operations.PROPERTY_EXTRACTORS,
+        {ImageProperty.SIZE: image_size_extractor},
+    ):
+        result = execute_operations(
+            value=detections,
+            operations=operations,
+            global_parameters={"classes": {"cat", "dog"}, "image": image},
+        )
+
+    # then
+    assert result.xyxy.tolist() == [[0, 0, 5, 5], [0, 0, 6, 6]]
+    assert (
+        image_size_extractor.call_count == 1
+    ), "Expected image size to be resolved once, not for each detection"
+
+
+@pytest.mark.parametrize(
+    "comparator, value, expected_confidence",
+    [
+        ("(Number) >", 0.1, [0.1, 0.7]),
+        ("(Number) <=", 0.1, []),
+        ("==", 0.7, []),
+    ],
+)
+@pytest.mark.parametrize("vectorizable", [True, False])
+def test_detections_filter_when_float32_confidence_compared_at_boundary(
+    comparator: str,
+    value: float,
+    expected_confidence: list,
+    vectorizable: bool,
+) -> None:
+    # given
+    statements = [
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {"type": "ExtractDetectionProperty", "property_name": "confidence"}
+                ],
+            },
+            "comparator": {"type": comparator},
+            "right_operand": {"type": "StaticOperand", "value": value},
+        }
+    ]
+    if not vectorizable:
+        statements.append(
+            {
+                "type": "UnaryStatement",
+                "operand": {
+                    "type": "DynamicOperand",
+                    "operations": [
+                        {
+                            "type": "ExtractDetectionProperty",
+                            "property_name": "class_name",
+                        }
+                    ],
+                },
+                "operator": {"type": "Exists"},
+            }
+        )
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": statements,
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 2, 2], [0, 0, 5, 5]], dtype=np.float32),
+        confidence=np.array([0.1, 0.7], dtype=np.float32),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={},
+    )
+
+    # then
+    assert result.confidence.tolist() == pytest.approx(expected_confidence)
+
+
+def test_detections_filter_when_detections_sampled_with_random_number() -> None:
+    # given
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "statements": [
+                    {
+                        "type": "BinaryStatement",
+                        "left_operand": {
+                            "type": "DynamicOperand",
+                            "operations": [
+                                {
+                                    "type": "ExtractDetectionProperty",
+                                    "property_name": "confidence",
+                                }
+                            ],
+                        },
+                        "comparator": {"type": "(Number) >="},
+                        "right_operand": {
+                            "type": "StaticOperand",
+                            "value": None,
+                            "operations": [{"type": "RandomNumber"}],
+                        },
+                    },
+                ],
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 2, 2]] * 1000),
+        confidence=np.array([0.5] * 1000),
+        class_id=np.array([0] * 1000),
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={},
+    )
+
+    # then
+    assert (
+        0 < len(result) < 1000
+    ), "Expected random number to be drawn for each detection, not once for all"
+
+
+@pytest.mark.parametrize(
+    "comparator, value, expected_confidence",
+    [
+        ("(Number) ==", [0.1, 0.7], []),
+        ("(Number) ==", [0.7], []),
+        ("(Number) !=", [0.1, 0.7], [0.1, 0.7]),
+    ],
+)
+@pytest.mark.parametrize("vectorizable", [True, False])
+def test_detections_filter_when_confidence_compared_for_equality_with_sequence(
+    comparator: str,
+    value: list,
+    expected_confidence: list,
+    vectorizable: bool,
+) -> None:
+    # given
+    statements = [
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {"type": "ExtractDetectionProperty", "property_name": "confidence"}
+                ],
+            },
+            "comparator": {"type": comparator},
+            "right_operand": {"type": "StaticOperand", "value": value},
+        }
+    ]
+    if not vectorizable:
+        statements.append(
+            {
+                "type": "UnaryStatement",
+                "operand": {
+                    "type": "DynamicOperand",
+                    "operations": [
+                        {
+                            "type": "ExtractDetectionProperty",
+                            "property_name": "class_name",
+                        }
+                    ],
+                },
+                "operator": {"type": "Exists"},
+            }
+        )
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": statements,
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 2, 2], [0, 0, 5, 5]]),
+        confidence=np.array([0.1, 0.7]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+
+    # when
+    result = execute_operations(
+        value=detections,
+        operations=operations,
+        global_parameters={},
+    )
+
+    # then
+    assert result.confidence.tolist() == pytest.approx(expected_confidence)
+
+
+@pytest.mark.parametrize(
+    "comparator, value",
+    [
+        ("(Number) >", [0.5, 0.5]),
+        ("(Number) <=", [0.5]),
+        ("(Number) >=", (0.5, 0.5)),
+    ],
+)
+@pytest.mark.parametrize("vectorizable", [True, False])
+def test_detections_filter_when_confidence_ordered_against_sequence(
+    comparator: str,
+    value: object,
+    vectorizable: bool,
+) -> None:
+    # given
+    statements = [
+        {
+            "type": "BinaryStatement",
+            "left_operand": {
+                "type": "DynamicOperand",
+                "operations": [
+                    {"type": "ExtractDetectionProperty", "property_name": "confidence"}
+                ],
+            },
+            "comparator": {"type": comparator},
+            "right_operand": {"type": "DynamicOperand", "operand_name": "value"},
+        }
+    ]
+    if not vectorizable:
+        statements.append(
+            {
+                "type": "UnaryStatement",
+                "operand": {
+                    "type": "DynamicOperand",
+                    "operations": [
+                        {
+                            "type": "ExtractDetectionProperty",
+                            "property_name": "class_name",
+                        }
+                    ],
+                },
+                "operator": {"type": "Exists"},
+            }
+        )
+    operations = [
+        {
+            "type": "DetectionsFilter",
+            "filter_operation": {
+                "type": "StatementGroup",
+                "operator": "and",
+                "statements": statements,
+            },
+        }
+    ]
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 2, 2], [0, 0, 5, 5]]),
+        confidence=np.array([0.1, 0.7]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+
+    # when
+    with pytest.raises(EvaluationEngineError):
+        _ = execute_operations(
+            value=detections,
+            operations=operations,
+            global_parameters={"value": value},
+        )
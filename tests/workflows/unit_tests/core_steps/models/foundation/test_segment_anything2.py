@@ -0,0 +1,197 @@
+from unittest import mock
+from unittest.mock import MagicMock
+
+import numpy as np
+import supervision as sv
+
+from inference.core.entities.responses.sam2 import (
+    Sam2SegmentationPrediction,
+    Sam2SegmentationResponse,
+)
+from inference.core.workflows.core_steps.common.entities import StepExecutionMode
+from inference.core.workflows.core_steps.models.foundation.segment_anything2 import (
+    v1,
+)
+from inference.core.workflows.core_steps.models.foundation.segment_anything2.v1 import (
+    SegmentAnything2BlockV1,
+    convert_sam2_segmentation_response_to_inference_instances_seg_response,
+)
+from inference.core.workflows.execution_engine.entities.base import (
+    ImageParentMetadata,
+    WorkflowImageData,
+)
+
+
+def test_convert_sam2_segmentation_response_when_prompts_provided() -> None:
+    # given
+    predictions = [
+        Sam2SegmentationPrediction(
+            masks=[[[10, 10], [20, 10], [20, 30], [10, 30]], [[1, 1], [2, 2]]],
+            confidence=0.9,
+        ),
+        Sam2SegmentationPrediction(
+            masks=[[[0, 0], [5, 0], [5, 5]]],
+            confidence=0.2,
+        ),
+    ]
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((100, 120, 3), dtype=np.uint8),
+    )
+
+    # when
+    result = convert_sam2_segmentation_response_to_inference_instances_seg_response(
+        sam2_segmentation_predictions=predictions,
+        image=image,
+        prompt_class_ids=[1, 2],
+        prompt_class_names=["cat", "dog"],
+        prompt_detection_ids=["a", "b"],
+        threshold=0.5,
+    )
+
+    # then
+    assert result.image.width == 120
+    assert result.image.height == 100
+    assert (
+        len(result.predictions) == 1
+    ), "Expected empty and low-confidence masks to be skipped"
+    prediction = result.predictions[0]
+    assert (prediction.x, prediction.y) == (15.0, 20.0)
+    assert (prediction.width, prediction.height) == (10.0, 20.0)
+    assert [(p.x, p.y) for p in prediction.points] == [
+        (10.0, 10.0),
+        (20.0, 10.0),
+        (20.0, 30.0),
+        (10.0, 30.0),
+    ]
+    assert prediction.class_name == "cat"
+    assert prediction.class_id == 1
+    assert prediction.parent_id == "a"
+
+
+def test_convert_sam2_segmentation_response_when_prompts_not_provided() -> None:
+    # given
+    predictions = [
+        Sam2SegmentationPrediction(
+            masks=[[[0, 0], [5, 0], [5, 5]]],
+            confidence=0.2,
+        ),
+    ]
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((100, 120, 3), dtype=np.uint8),
+    )
+
+    # when
+    result = convert_sam2_segmentation_response_to_inference_instances_seg_response(
+        sam2_segmentation_predictions=predictions,
+        image=image,
+        prompt_class_ids=[],
+        prompt_class_names=[],
+        prompt_detection_ids=[],
+        threshold=0.0,
+    )
+
+    # then
+    assert len(result.predictions) == 1
+    assert result.predictions[0].class_name == "foreground"
+    assert result.predictions[0].class_id == 0
+    assert result.predictions[0].parent_id is None
+
+
+@mock.patch.object(v1, "load_core_model", MagicMock(return_value="sam2/hiera_tiny"))
+def test_segment_anything2_run_locally_when_prompts_provided() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.infer_from_request_sync.return_value = Sam2SegmentationResponse(
+        predictions=[
+            Sam2SegmentationPrediction(
+                masks=[[[10, 10], [20, 10], [20, 30], [10, 30]]],
+                confidence=0.9,
+            ),
+            Sam2SegmentationPrediction(
+                masks=[[[10, 10], [20, 10], [20, 30], [10, 30]]],
+                confidence=0.9,
+            ),
+        ],
+        time=0.1,
+    )
+    block = SegmentAnything2BlockV1(
+        model_manager=model_manager,
+        api_key=None,
+        step_execution_mode=StepExecutionMode.LOCAL,
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((100, 120, 3), dtype=np.uint8),
+    )
+    boxes = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 20], [5, 5, 15, 15]], dtype=np.float32),
+        class_id=np.array([1, 2]),
+        confidence=np.array([0.5, 0.6]),
+        data={
+            "class_name": np.array(["cat", "dog"]),
+            "detection_id": np.array(["a", "b"]),
+        },
+    )
+
+    # when
+    result = block.run_locally(
+        images=[image],
+        boxes=[boxes],
+        version="hiera_tiny",
+        threshold=0.0,
+        multimask_output=True,
+    )
+
+    # then
+    request = model_manager.infer_from_request_sync.call_args[0][1]
+    assert [
+        (p.box.x, p.box.y, p.box.width, p.box.height) for p in request.prompts.prompts
+    ] == [
+        (5.0, 10.0, 10.0, 20.0),
+        (10.0, 10.0, 10.0, 10.0),
+    ]
+    detections = result[0]["predictions"]
+    assert detections.class_id.tolist() == [1, 2]
+    assert detections.data["class_name"].tolist() == ["cat", "dog"]
+
+
+@mock.patch.object(v1, "load_core_model", MagicMock(return_value="sam2/hiera_tiny"))
+def test_segment_anything2_run_locally_when_empty_prompts_provided() -> None:
+    # given
+    model_manager = MagicMock()
+    model_manager.infer_from_request_sync.return_value = Sam2SegmentationResponse(
+        predictions=[
+            Sam2SegmentationPrediction(
+                masks=[[[10, 10], [20, 10], [20, 30], [10, 30]]],
+                confidence=0.9,
+            )
+        ],
+        time=0.1,
+    )
+    block = SegmentAnything2BlockV1(
+        model_manager=model_manager,
+        api_key=None,
+        step_execution_mode=StepExecutionMode.LOCAL,
+    )
+    image = WorkflowImageData(
+        parent_metadata=ImageParentMetadata(parent_id="parent"),
+        numpy_image=np.zeros((100, 120, 3), dtype=np.uint8),
+    )
+
+    # when
+    result = block.run_locally(
+        images=[image, image],
+        boxes=[sv.Detections.empty(), None],
+        version="hiera_tiny",
+        threshold=0.0,
+        multimask_output=True,
+    )
+
+    # then
+    assert len(result) == 2
+    for element in result:
+        detections = element["predictions"]
+        assert len(detections) == 1
+        assert detections.data["class_name"].tolist() == ["foreground"]
@@ -0,0 +1,144 @@
+from unittest import mock
+
+import numpy as np
+import supervision as sv
+
+from inference.core.workflows.core_steps.transformations.detections_transformation import (
+    v1,
+)
+from inference.core.workflows.core_steps.transformations.detections_transformation.v1 import (
+    BlockManifest,
+    DetectionsTransformationBlockV1,
+)
+
+
+def test_detections_transformation_block_builds_operations_chain_once() -> None:
+    # given
+    manifest = BlockManifest.model_validate(
+        {
+            "type": "roboflow_core/detections_transformation@v1",
+            "name": "filtering",
+            "predictions": "$steps.detection.predictions",
+            "operations": [
+                {
+                    "type": "DetectionsFilter",
+                    "filter_operation": {
+                        "type": "StatementGroup",
+                        "statements": [
+                            {
+                                "type": "BinaryStatement",
+                                "left_operand": {
+                                    "type": "DynamicOperand",
+                                    "operations": [
+                                        {
+                                            "type": "ExtractDetectionProperty",
+                                            "property_name": "class_name",
+                                        }
+                                    ],
+                                },
+                                "comparator": {"type": "in (Sequence)"},
+                                "right_operand": {
+                                    "type": "DynamicOperand",
+                                    "operand_name": "classes",
+                                },
+                            }
+                        ],
+                    },
+                }
+            ],
+            "operations_parameters": {"classes": "$inputs.classes"},
+        }
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [10, 10, 20, 20]]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+    block = DetectionsTransformationBlockV1()
+
+    # when
+    with mock.patch.object(
+        v1, "build_operations_chain", wraps=v1.build_operations_chain
+    ) as build_operations_chain_mock:
+        first_result = block.run(
+            predictions=[detections],
+            operations=manifest.operations,
+            operations_parameters={"classes": {"cat"}},
+        )
+        second_result = block.run(
+            predictions=[detections, detections],
+            operations=manifest.operations,
+            operations_parameters={"classes": {"dog"}},
+        )
+
+    # then
+    assert build_operations_chain_mock.call_count == 1
+    assert first_result[0]["predictions"].data["class_name"].tolist() == ["cat"]
+    assert len(second_result) == 2
+    assert second_result[1]["predictions"].data["class_name"].tolist() == ["dog"]
+
+
+def test_detections_transformation_block_rebuilds_chain_when_operations_change() -> (
+    None
+):
+    # given
+    manifest = BlockManifest.model_validate(
+        {
+            "type": "roboflow_core/detections_transformation@v1",
+            "name": "filtering",
+            "predictions": "$steps.detection.predictions",
+            "operations": [
+                {
+                    "type": "DetectionsFilter",
+                    "filter_operation": {
+                        "type": "StatementGroup",
+                        "statements": [
+                            {
+                                "type": "BinaryStatement",
+                                "left_operand": {
+                                    "type": "DynamicOperand",
+                                    "operations": [
+                                        {
+                                            "type": "ExtractDetectionProperty",
+                                            "property_name": "class_name",
+                                        }
+                                    ],
+                                },
+                                "comparator": {"type": "in (Sequence)"},
+                                "right_operand": {
+                                    "type": "DynamicOperand",
+                                    "operand_name": "classes",
+                                },
+                            }
+                        ],
+                    },
+                }
+            ],
+            "operations_parameters": {"classes": "$inputs.classes"},
+        }
+    )
+    detections = sv.Detections(
+        xyxy=np.array([[0, 0, 10, 10], [10, 10, 20, 20]]),
+        class_id=np.array([0, 1]),
+        data={"class_name": np.array(["cat", "dog"])},
+    )
+    block = DetectionsTransformationBlockV1()
+
+    # when
+    with mock.patch.object(
+        v1, "build_operations_chain", wraps=v1.build_operations_chain
+    ) as build_operations_chain_mock:
+        _ = block.run(
+            predictions=[detections],
+            operations=manifest.operations,
+            operations_parameters={"classes": {"cat"}},
+        )
+        result = block.run(
+            predictions=[detections],
+            operations=[],
+            operations_parameters={},
+        )
+
+    # then
+    assert build_operations_chain_mock.call_count == 2
+    assert len(result[0]["predictions"]) == 2
@@ -46,6 +46,34 @@ def test_assemble_runtime_parameters_when_image_is_not_provided() -> None:
         )
 
 
+@mock.patch.object(deserializers, "load_image_from_url")
+def test_assemble_runtime_parameters_when_one_of_images_is_not_provided(
+    load_image_from_url_mock: MagicMock,
+) -> None:
+    # given
+    runtime_parameters = {
+        "image1": {
+            "type": "url",
+            "value": "https://some.com/image.jpg",
+        }
+    }
+    defined_inputs = [
+        WorkflowImage(type="WorkflowImage", name="image1"),
+        WorkflowImage(type="WorkflowImage", name="image2"),
+    ]
+
+    # when
+    with pytest.raises(RuntimeInputError):
+        _ = assemble_runtime_parameters(
+            runtime_parameters=runtime_parameters,
+            defined_inputs=defined_inputs,
+            kinds_deserializers=KINDS_DESERIALIZERS,
+        )
+
+    # then
+    load_image_from_url_mock.assert_not_called()
+
+
 @mock.patch.object(deserializers, "load_image_from_url")
 def test_assemble_runtime_parameters_when_image_is_provided_as_single_element_dict(
     load_image_from_url_mock: MagicMock,